@@ -33,8 +33,15 @@ import busio, board, logging
 from time import time, sleep
 import adafruit_ads1x15.ads1115 as ADS
 from adafruit_ads1x15.analog_in import AnalogIn
+try:
+    from .MadcDriver import adcDriver, averageCounts, formatValues, changeDetector
+except ImportError:   # running this file directly for the demo below
+    from MadcDriver import adcDriver, averageCounts, formatValues, changeDetector
 
-class ads1115:
+# Full scale voltage for each gain. AnalogIn.value is a signed 16 bit count (+/-32767)
+PGA_RANGE = {2/3: 6.144, 1: 4.096, 2: 2.048, 4: 1.024, 8: 0.512, 16: 0.256}
+
+class ads1115(adcDriver):
     ''' ADC using ADS1115 (I2C). Returns a list with voltge values '''
     
     def __init__(self, numOfChannels=1, noiseThreshold=0.001, maxInterval=1, usergain=1, useraddress=0x48):
@@ -48,41 +55,19 @@ class ads1115:
                      AnalogIn(ads, ADS.P1),
                      AnalogIn(ads, ADS.P2),
                      AnalogIn(ads, ADS.P3)]
+        self.scale = PGA_RANGE[usergain] / 32767   # volts per raw count
         self.noiseThreshold = noiseThreshold
         self.numOfSamples = 10        # Number of samples to average
         self.maxInterval = maxInterval  # interval in seconds to check for update
-        self.time0 = time()   # time 0
-        # Initialize lists
-        self.sensorAve = [x for x in range(self.numOfChannels)]
-        self.sensorLastRead = [x for x in range(self.numOfChannels)]
-        self.adcValue = [x for x in range(self.numOfChannels)]
-        self.sensor = [[x for x in range(0, self.numOfSamples)] for x in range(0, self.numOfChannels)]
-        for x in range(self.numOfChannels): # initialize the first read for comparison later
-            self.sensorLastRead[x] = self.chan[x].value
+        self.detector = changeDetector(noiseThreshold, maxInterval) # noise threshold is in Volts
 
     def getValue(self):
         ''' If adc is above noise threshold or time limit exceeded will return voltage of each channel '''
         
-        sensorChanged = False
-        timelimit = False
-        if time() - self.time0 > self.maxInterval:
-            timelimit = True
-        for x in range(self.numOfChannels):
-            for i in range(self.numOfSamples):  # get samples points from analog pin and average
-                self.sensor[x][i] = self.chan[x].voltage
-            self.sensorAve[x] = sum(self.sensor[x])/len(self.sensor[x])
-            if abs(self.sensorAve[x] - self.sensorLastRead[x]) > self.noiseThreshold:
-                sensorChanged = True
-                logging.debug('changed: {0} chan: {1} value: {2:1.3f} previously: {3:1.3f}'.format(sensorChanged, x, self.sensorAve[x], self.sensorLastRead[x]))
-            self.adcValue[x] = self.sensorAve[x]            
-            self.sensorLastRead[x] = self.sensorAve[x]
-            #logging.debug('chan: {0} value: {1:1.2f}'.format(x, self.adcValue[x]))
-        if sensorChanged or timelimit:
-            self.adcValue = ["%.3f"%pin for pin in self.adcValue] #format and send final adc results
-            self.time0 = time()
-            return self.adcValue
-        else:
-            pass
+        block = self.read_block(range(self.numOfChannels), self.numOfSamples)
+        self.adcValue = block.toVolts(averageCounts(block))
+        if self.detector.update(self.adcValue):
+            return formatValues(self.adcValue) #format and send final adc results
       
 if __name__ == "__main__":
     
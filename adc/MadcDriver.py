@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+''' Common interface shared by the adc drivers (ads1115, mcp3008).
+
+A driver only has to create its analog input channels (self.chan) and set
+self.scale (volts per raw count). read_block(channels, n) then returns an
+adcBlock with the raw counts as a typed array, the scale and a timestamp for
+every reading. Averaging, change detection and formatting are separate stages
+that work on the block, so any consumer (or new chip like ADS1015/MCP3208)
+can reuse them.
+
+  block = adc.read_block([0, 1], 10)       # 10 samples from channels 0 and 1
+  counts = averageCounts(block)            # mean raw count per channel
+  voltage = block.toVolts(counts)          # mean voltage per channel
+  if detector.update(voltage):             # above noise threshold or max interval
+      print(formatValues(voltage))         # ['1.652', '0.003']
+'''
+
+import logging
+from array import array
+from time import time
+
+class adcBlock:
+    ''' Raw counts from read_block. Counts and timestamps are stored channel by channel,
+        n samples each, so channel k is at [k*n:(k+1)*n] '''
+
+    def __init__(self, channels, n, scale):
+        self.channels = list(channels)
+        self.n = n
+        self.scale = scale                # volts per raw count
+        self.counts = array('l')          # raw adc counts
+        self.timestamps = array('d')      # time() of each reading
+
+    def channel(self, k):
+        ''' Raw counts for the k-th channel in the block '''
+
+        return self.counts[k*self.n:(k+1)*self.n]
+
+    def toVolts(self, counts):
+        ''' Convert a list of (averaged) raw counts to voltage '''
+
+        return [count * self.scale for count in counts]
+
+class adcDriver:
+    ''' Base class for the adc drivers. Subclass creates self.chan and sets self.scale '''
+
+    chan = []
+    scale = 1.0
+
+    def read_block(self, channels, n):
+        ''' Read n samples from each channel in channels. Returns an adcBlock with raw counts '''
+
+        block = adcBlock(channels, n, self.scale)
+        counts, timestamps = block.counts, block.timestamps
+        for x in block.channels:
+            pin = self.chan[x]
+            for i in range(n):
+                counts.append(pin.value)
+                timestamps.append(time())
+        return block
+
+def averageCounts(block):
+    ''' Mean raw count of each channel in the block '''
+
+    return [sum(block.channel(k))/block.n for k in range(len(block.channels))]
+
+def formatValues(values):
+    ''' Format values for publishing. Returns a list of strings '''
+
+    return ["%.3f"%value for value in values]
+
+class changeDetector:
+    ''' Returns True if any value changed more than the noise threshold or the max time interval
+        was exceeded. Threshold is in the same units as the values passed to update '''
+
+    def __init__(self, noiseThreshold, maxInterval=1):
+        self.noiseThreshold = noiseThreshold
+        self.maxInterval = maxInterval  # interval in seconds to check for update
+        self.time0 = time()   # time 0
+        self.lastRead = None
+
+    def update(self, values):
+        ''' Compare values with the previous update and store them for the next comparison '''
+
+        sensorChanged = False
+        timelimit = False
+        if time() - self.time0 > self.maxInterval:
+            timelimit = True
+        if self.lastRead is None:        # first read has nothing to compare against
+            sensorChanged = True
+        else:
+            for x, value in enumerate(values):
+                if abs(value - self.lastRead[x]) > self.noiseThreshold:
+                    sensorChanged = True
+                    logging.debug('changed: {0} chan: {1} value: {2:1.3f} previously: {3:1.3f}'.format(sensorChanged, x, value, self.lastRead[x]))
+        self.lastRead = list(values)
+        if sensorChanged or timelimit:
+            self.time0 = time()
+            return True
+        return False
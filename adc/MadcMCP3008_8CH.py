@@ -25,8 +25,12 @@ import busio, digitalio, board, logging
 import adafruit_mcp3xxx.mcp3008 as MCP
 from adafruit_mcp3xxx.analog_in import AnalogIn
 from time import time, sleep
+try:
+    from .MadcDriver import adcDriver, averageCounts, formatValues, changeDetector
+except ImportError:   # running this file directly for the demo below
+    from MadcDriver import adcDriver, averageCounts, formatValues, changeDetector
 
-class mcp3008:
+class mcp3008(adcDriver):
     ''' ADC using MCP3008 (SPI). Returns a list with voltge values '''
 
     def __init__(self, numOfChannels, vref, noiseThreshold=350, maxInterval=1, cs=8):
@@ -52,17 +56,11 @@ class mcp3008:
                      AnalogIn(mcp, MCP.P5),
                      AnalogIn(mcp, MCP.P6),
                      AnalogIn(mcp, MCP.P7)]
+        self.scale = self.valmap(1, 0, 65535, 0, self.vref) # volts per raw count. AnalogIn.value is 16 bit (0-65535)
         self.noiseThreshold = noiseThreshold
         self.numOfSamples = 10             # Number of samples to average
         self.maxInterval = maxInterval  # interval in seconds to check for update
-        self.time0 = time()   # time 0
-        # Initialize lists
-        self.sensorAve = [x for x in range(self.numOfChannels)]
-        self.sensorLastRead = [x for x in range(self.numOfChannels)]
-        self.adcValue = [x for x in range(self.numOfChannels)]
-        self.sensor = [[x for x in range(0, self.numOfSamples)] for x in range(0, self.numOfChannels)]
-        for x in range(self.numOfChannels): # initialize the first read for comparison later
-            self.sensorLastRead[x] = self.chan[x].value
+        self.detector = changeDetector(noiseThreshold, maxInterval) # noise threshold is in raw ADC
     
     def valmap(self, value, istart, istop, ostart, ostop):
         ''' Used to convert from raw ADC to voltage '''
@@ -72,26 +70,11 @@ class mcp3008:
     def getValue(self):
         ''' If adc is above noise threshold or time limit exceeded will return voltage of each channel '''
         
-        sensorChanged = False
-        timelimit = False
-        if time() - self.time0 > self.maxInterval:
-            timelimit = True
-        for x in range(self.numOfChannels):
-            for i in range(self.numOfSamples):  # get samples points from analog pin and average
-                self.sensor[x][i] = self.chan[x].value
-            self.sensorAve[x] = sum(self.sensor[x])/len(self.sensor[x])
-            if abs(self.sensorAve[x] - self.sensorLastRead[x]) > self.noiseThreshold:
-                sensorChanged = True
-                logging.debug('changed: {0} chan: {1} value: {2:1.3f} previously: {3:1.3f}'.format(sensorChanged, x, self.sensorAve[x], self.sensorLastRead[x]))
-            self.adcValue[x] = self.valmap(self.sensorAve[x], 0, 65535, 0, self.vref) # 4mV change is approx 500
-            self.sensorLastRead[x] = self.sensorAve[x]
-            #logging.debug('chan: {0} value: {1:1.3f}'.format(x, self.adcValue[x]))
-        if sensorChanged or timelimit:
-            self.adcValue = ["%.3f"%item for item in self.adcValue] #format and send final adc results
-            self.time0 = time()
-            return self.adcValue
-        else:
-            pass
+        block = self.read_block(range(self.numOfChannels), self.numOfSamples)
+        sensorAve = averageCounts(block)
+        self.adcValue = block.toVolts(sensorAve) # 4mV change is approx 500
+        if self.detector.update(sensorAve):
+            return formatValues(self.adcValue) #format and send final adc results
       
 if __name__ == "__main__":
   
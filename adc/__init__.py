@@ -1,2 +1,3 @@
+from .MadcDriver import adcDriver, adcBlock, averageCounts, formatValues, changeDetector
 from .MadcMCP3008_8CH import mcp3008
-from .MadcADS1115_4CH import ads1115
\ No newline at end of file
+from .MadcADS1115_4CH import ads1115